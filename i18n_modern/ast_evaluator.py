@@ -9,30 +9,55 @@ from __future__ import annotations
 import ast
 import functools
 import operator as op
-from typing import Callable, TypeVar, Type
+from typing import Any, Callable, Type
 
 from .types import FormatValue
 
 
-_T = TypeVar('_T')
+_OP_MAP: dict[Type[ast.cmpop], Callable[[Any, Any], bool]] = {
+    ast.Gt: op.gt,
+    ast.GtE: op.ge,
+    ast.Lt: op.lt,
+    ast.LtE: op.le,
+    ast.Eq: op.eq,
+    ast.NotEq: op.ne,
+}
 
-def _get_operator(op_type: Type[ast.cmpop]) -> Callable[[_T, _T], bool]:
-    if op_type is ast.Gt:
-        return op.gt
-    if op_type is ast.GtE:
-        return op.ge
-    if op_type is ast.Lt:
-        return op.lt
-    if op_type is ast.LtE:
-        return op.le
-    if op_type is ast.Eq:
-        return op.eq
-    if op_type is ast.NotEq:
-        return op.ne
-    raise ValueError('unknown operator type')
+# Source tokens used when generating code for comparison chains
+_OP_SOURCE: dict[Type[ast.cmpop], str] = {
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+}
+
+_ORDERING_OPS: frozenset[Type[ast.cmpop]] = frozenset((ast.Gt, ast.GtE, ast.Lt, ast.LtE))
+
+_NO_PARAMS: frozenset[str] = frozenset()
+
+def _always_true(*_: object) -> bool:
+    return True
+
+def _always_false(*_: object) -> bool:
+    return False
+
+def _invalid() -> bool:
+    raise ValueError("Unsupported expression branch")
+
+def _as_bool(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    raise ValueError(f"Unsupported operand in boolean context: {value!r}")
 
 class ASTExpressionEvaluator:
-    """Evaluator for safe boolean expressions using Python AST."""
+    """Evaluator for safe boolean expressions using Python AST.
+
+    Constant expressions are folded once and their result cached. Expressions
+    over named parameters are compiled once to straight-line Python code, so
+    evaluating them for new values needs no parsing or AST traversal.
+    """
 
     @staticmethod
     @functools.lru_cache(maxsize=512)
@@ -52,6 +77,26 @@ class ASTExpressionEvaluator:
         except (SyntaxError, AssertionError):
             return None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _fold(expression: str) -> bool:
+        """Fold and cache the result of a constant boolean expression.
+
+        Args:
+            expression: String expression to fold
+
+        Returns:
+            Boolean result; False if the expression is invalid or unsupported
+        """
+        tree = ASTExpressionEvaluator.parse(expression)
+        if tree is None:
+            return False
+
+        try:
+            return ASTExpressionEvaluator._emit_node(tree.body, _NO_PARAMS, []) is True
+        except (ValueError, TypeError):
+            return False
+
     @classmethod
     def evaluate(cls, expression: str) -> bool:
         """Safely evaluate a boolean expression.
@@ -62,87 +107,223 @@ class ASTExpressionEvaluator:
         Returns:
             Boolean result of evaluation
         """
+        return cls._fold(expression)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def parse_operand(text: str) -> FormatValue:
+        """Parse and cache a single literal operand, as it would read inside an expression.
+
+        Args:
+            text: Operand source (e.g. "5", "-1.5", "True" or "'en'")
+
+        Returns:
+            Parsed value (bool, int, float, or str)
+
+        Raises:
+            ValueError: If the text is not a supported literal operand
+        """
+        try:
+            tree = ast.parse(text, mode="eval")
+        except SyntaxError:
+            raise ValueError(f"Invalid operand: {text}") from None
+        return ASTExpressionEvaluator._fold_operand(tree.body)
+
+    @classmethod
+    def compile_predicate(cls, expression: str, params: tuple[str, ...]) -> Callable[..., bool]:
+        """Compile a boolean expression over named parameters into a function.
+
+        Parameters appear in the expression as plain names and become positional
+        arguments of the returned function, so an expression such as
+        ``n > 1 and n < 5`` is compiled once into ``lambda n: n > 1 and n < 5``
+        instead of being parsed again for every value of ``n``. Sub-expressions
+        without parameters are folded here; constants are bound as defaults rather
+        than spelled out in the source, so no value is ever rendered into code.
+
+        Args:
+            expression: Boolean expression string
+            params: Parameter names, in argument order; must not start with ``_``
+
+        Returns:
+            Function taking one argument per parameter and returning the boolean
+            result. It raises TypeError for operands that cannot be ordered and
+            ValueError when it reaches an invalid branch or a bare parameter
+            whose value is not a bool.
+
+        Raises:
+            ValueError: If the expression is invalid or unsupported
+        """
         tree = cls.parse(expression)
         if tree is None:
-            return False
+            raise ValueError(f"Invalid expression: {expression}")
 
-        try:
-            return cls._evaluate_node(tree.body)
-        except (ValueError, TypeError):
-            return False
+        constants: list[FormatValue] = []
+        source = cls._emit_node(tree.body, frozenset(params), constants)
+        if isinstance(source, bool):
+            return _always_true if source else _always_false
+
+        signature = ", ".join([*params, *(f"_c{index}=_c{index}" for index in range(len(constants)))])
+        code = compile(f"lambda {signature}: {source}", "<i18n-expr>", "eval")
+        namespace: dict[str, Any] = {f"_c{index}": value for index, value in enumerate(constants)}
+        namespace["_invalid"] = _invalid
+        namespace["_as_bool"] = _as_bool
+        namespace["__builtins__"] = {}
+        return eval(code, namespace)
 
     @classmethod
-    def _evaluate_node(cls, node: ast.expr) -> bool:
-        """Evaluate a parsed AST node representing a conditional expression.
+    def _emit_node(cls, node: ast.expr, params: frozenset[str], constants: list[FormatValue]) -> str | bool:
+        """Fold a conditional expression node, or generate source if it uses parameters.
 
         Args:
             node: AST expression node
+            params: Names that refer to parameters
+            constants: Constant pool; operands are appended and referenced as ``_c<index>``
 
         Returns:
-            Boolean result
+            The boolean itself when the node folds to a constant, else a source fragment
 
         Raises:
             ValueError: If node type is unsupported
         """
         if isinstance(node, ast.BoolOp):
-            return cls._evaluate_bool_op(node)
+            return cls._emit_bool_op(node, params, constants)
 
         if isinstance(node, ast.Compare):
-            return cls._evaluate_compare(node)
+            return cls._emit_compare(node, params, constants)
 
         if isinstance(node, ast.Constant) and isinstance(node.value, bool):
             return node.value
 
+        # A bare parameter stands where a bool constant may, so its value must be a bool
+        if isinstance(node, ast.Name) and node.id in params:
+            return f"_as_bool({node.id})"
+
         raise ValueError(f"Unsupported node type: {type(node)}")
 
     @classmethod
-    def _evaluate_bool_op(cls, node: ast.BoolOp) -> bool:
-        """Evaluate boolean operations (and/or).
+    def _emit_bool_op(cls, node: ast.BoolOp, params: frozenset[str], constants: list[FormatValue]) -> str | bool:
+        """Fold or generate source for boolean operations (and/or) with short-circuit semantics.
+
+        Branches are joined with Python's own short-circuiting ``and``/``or``, so
+        evaluation stops at the first decisive branch. A branch that folds to a
+        deciding constant ends the operation right here, and any branches after it,
+        even invalid ones, are never looked at. An invalid branch that can be
+        reached makes the expression invalid: immediately if nothing before it can
+        decide the result, otherwise through a call that raises once it is reached.
 
         Args:
             node: BoolOp AST node
+            params: Names that refer to parameters
+            constants: Constant pool shared with the enclosing expression
 
         Returns:
-            Boolean result
-        """
-        results = [cls._evaluate_node(value) for value in node.values]
+            Source fragment, or the boolean itself when the operation folds to a constant
 
+        Raises:
+            ValueError: If the operator is unsupported or the first reachable
+                branch is invalid
+        """
         if isinstance(node.op, ast.And):
-            return all(results)
-        if isinstance(node.op, ast.Or):
-            return any(results)
-
-        raise ValueError(f"Unsupported boolean operator: {type(node.op)}")
+            absorbing, keyword = False, " and "
+        elif isinstance(node.op, ast.Or):
+            absorbing, keyword = True, " or "
+        else:
+            raise ValueError(f"Unsupported boolean operator: {type(node.op)}")
+
+        branches: list[str] = []
+        for value in node.values:
+            pool_size = len(constants)
+            try:
+                branch = cls._emit_node(value, params, constants)
+            except (ValueError, TypeError):
+                if not branches:
+                    raise
+                del constants[pool_size:]
+                branches.append("_invalid()")
+                break
+
+            if branch is absorbing:
+                if not branches:
+                    return absorbing
+                branches.append(repr(absorbing))
+                break
+            if isinstance(branch, str):
+                branches.append(f"({branch})")
+
+        if not branches:
+            return not absorbing
+        return keyword.join(branches)
 
     @classmethod
-    def _evaluate_compare(cls, node: ast.Compare) -> bool:
-        """Evaluate comparison operations.
+    def _emit_compare(cls, node: ast.Compare, params: frozenset[str], constants: list[FormatValue]) -> str | bool:
+        """Fold or generate source for comparison operations.
 
         Args:
             node: Compare AST node
+            params: Names that refer to parameters
+            constants: Constant pool shared with the enclosing expression
 
         Returns:
-            Boolean result of comparison chain
+            The boolean result of a chain of constants, else a source fragment
+
+        Raises:
+            ValueError: If an operator or operand is unsupported, or constant
+                operands reached in the chain are incompatible for ordering
         """
-        left = cls._evaluate_operand(node.left)
+        for operator in node.ops:
+            if type(operator) not in _OP_MAP:
+                raise ValueError(f"Unsupported comparison operator: {type(operator)}")
+
+        operand_nodes = [node.left, *node.comparators]
+        if not params or not any(isinstance(operand, ast.Name) and operand.id in params for operand in operand_nodes):
+            return cls._fold_compare(node.ops, [cls._fold_operand(operand) for operand in operand_nodes])
+
+        names = []
+        for operand in operand_nodes:
+            if isinstance(operand, ast.Name) and operand.id in params:
+                names.append(operand.id)
+            else:
+                names.append(f"_c{len(constants)}")
+                constants.append(cls._fold_operand(operand))
+
+        parts = [names[0]]
+        for operator, name in zip(node.ops, names[1:]):
+            parts.append(_OP_SOURCE[type(operator)])
+            parts.append(name)
+        return " ".join(parts)
+
+    @classmethod
+    def _fold_compare(cls, ops: list[ast.cmpop], operands: list[FormatValue]) -> bool:
+        """Evaluate a comparison chain of constant operands.
+
+        Each pair is type-checked only when the chain reaches it.
+
+        Args:
+            ops: AST comparison operators
+            operands: Folded operands, left to right
+
+        Returns:
+            Boolean result of the comparison chain
 
-        for operator, comparator in zip(node.ops, node.comparators):
-            right = cls._evaluate_operand(comparator)
-            if not cls._apply_comparison(operator, left, right):
+        Raises:
+            ValueError: If operand types reached in the chain are incompatible for ordering
+        """
+        for operator, left, right in zip(ops, operands, operands[1:]):
+            cls._check_comparable(operator, left, right)
+            if not _OP_MAP[type(operator)](left, right):
                 return False
-            left = right
 
         return True
 
     @staticmethod
-    def _evaluate_operand(node: ast.expr) -> FormatValue:
-        """Evaluate an operand within a conditional expression.
+    def _fold_operand(node: ast.expr) -> FormatValue:
+        """Fold an operand within a conditional expression to its constant value.
 
         Args:
             node: AST expression node
 
         Returns:
-            Evaluated value (bool, int, float, or str)
+            Folded value (bool, int, float, or str)
 
         Raises:
             ValueError: If operand type is unsupported
@@ -153,7 +334,7 @@ class ASTExpressionEvaluator:
 
         # Handle unary operations (+/-)
         if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
-            operand = ASTExpressionEvaluator._evaluate_operand(node.operand)
+            operand = ASTExpressionEvaluator._fold_operand(node.operand)
             if isinstance(operand, (int, float)):
                 return operand if isinstance(node.op, ast.UAdd) else -operand
             raise ValueError(f"Invalid unary operation on {type(operand)}")
@@ -161,56 +342,25 @@ class ASTExpressionEvaluator:
         raise ValueError(f"Unsupported operand type: {type(node)}")
 
     @staticmethod
-    def _apply_comparison(operator: ast.cmpop, left: FormatValue, right: FormatValue) -> bool:
-        """Apply a comparison operator between two values.
-
-        Args:
-            operator: AST comparison operator
-            left: Left operand
-            right: Right operand
-
-        Returns:
-            Boolean result of comparison
-
-        Raises:
-            ValueError: If comparison is invalid
-        """
-        # Equality/inequality work on any types
-        if isinstance(operator, ast.Eq):
-            return left == right
-        if isinstance(operator, ast.NotEq):
-            return left != right
-
-        # Ordering comparisons
-        if isinstance(operator, (ast.Gt, ast.GtE, ast.Lt, ast.LtE)):
-            return ASTExpressionEvaluator._compare_ordered(operator, left, right)
-
-        raise ValueError(f"Unsupported comparison operator: {type(operator)}")
-
-    @staticmethod
-    def _compare_ordered(operator: ast.cmpop, left: FormatValue, right: FormatValue) -> bool:
-        """Compare two values using an ordering operator.
+    def _check_comparable(operator: ast.cmpop, left: FormatValue, right: FormatValue) -> None:
+        """Check that two mixed-type values can be compared with an operator.
 
         Args:
             operator: AST comparison operator
             left: Left operand
             right: Right operand
 
-        Returns:
-            Boolean result
-
         Raises:
             ValueError: If types are incompatible for ordering
         """
-        op_type = type(operator)
-        comparator = _get_operator(op_type)
+        # Equality/inequality work on any types
+        if type(operator) not in _ORDERING_OPS:
+            return
 
-        # String comparison
         if isinstance(left, str) and isinstance(right, str):
-            return comparator(left, right)
+            return
 
-        # Numeric comparison
         if isinstance(left, (int, float, bool)) and isinstance(right, (int, float, bool)):
-            return comparator(float(left), float(right))
+            return
 
         raise ValueError(f"Cannot compare {type(left)} with {type(right)}")
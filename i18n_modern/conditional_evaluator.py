@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import functools
 import logging
+import math
 import re
 from typing import TYPE_CHECKING
 
@@ -15,7 +16,7 @@ from .ast_evaluator import ASTExpressionEvaluator
 from .value_substitution import ValueSubstitutor
 
 if TYPE_CHECKING:
-    from .types import FormatParam
+    from .types import ConditionFunc, FormatParam, FormatValue
 
 # Pattern to validate safe conditional expressions
 _SAFE_EXPRESSION_PATTERN: re.Pattern[str] = re.compile(
@@ -23,6 +24,27 @@ _SAFE_EXPRESSION_PATTERN: re.Pattern[str] = re.compile(
 )
 
 
+def _to_operand(value: FormatValue) -> FormatValue:
+    """Convert a value to the operand its text reads as inside an expression.
+
+    Surrounding whitespace is ignored, as it would be around a substituted operand.
+    """
+    value_type = type(value)
+    if value_type is int or value_type is bool:
+        return value
+    if value_type is float and math.isfinite(value):
+        return value
+    return ASTExpressionEvaluator.parse_operand(str(value).strip())
+
+
+def _always_matches(values: FormatParam | None) -> bool:
+    return True
+
+
+def _never_matches(values: FormatParam | None) -> bool:
+    return False
+
+
 class ConditionalKeyEvaluator:
     """Evaluator for conditional translation keys."""
 
@@ -99,29 +121,61 @@ class ConditionalKeyEvaluator:
             >>> ConditionalKeyEvaluator.evaluate("[name] == 'John'", {"name": "Jane"})
             False
         """
+        return cls.compile(key)(values)
+
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def compile(cls, key: str) -> ConditionFunc:
+        """Compile a conditional key into a predicate over format values.
+
+        Validation, operator normalization and classification of the key happen
+        once here. Expressions are compiled with their placeholders as parameters,
+        so the returned predicate only converts the values and calls compiled code.
+
+        Args:
+            key: Conditional key expression to compile
+
+        Returns:
+            Predicate taking the values and returning the boolean result
+
+        Examples:
+            >>> ConditionalKeyEvaluator.compile("[count] > 1")({"count": 5})
+            True
+        """
         if not cls.is_safe_expression(key):
-            logging.warning("Unsafe or invalid conditional key: '%s'", key)
-            return False
+
+            def reject(values: FormatParam | None) -> bool:
+                # Warn on use rather than on compile: compiling a group compiles all of its keys
+                logging.warning("Unsafe or invalid conditional key: '%s'", key)
+                return False
+
+            return reject
 
         # Normalize logical operators
         normalized_key = cls._normalize_operators(key)
+        has_placeholders = ValueSubstitutor.has_placeholders(normalized_key)
 
         # Check if expression contains logical/comparison operators
-        has_logic = cls._has_logical_operators(normalized_key)
-
-        # Substitute placeholder values
-        substituted = ValueSubstitutor.substitute(normalized_key, values)
-
-        if has_logic:
+        if cls._has_logical_operators(normalized_key):
             # Evaluate as boolean expression using AST
-            return ASTExpressionEvaluator.evaluate(substituted)
+            if not has_placeholders:
+                return _always_matches if ASTExpressionEvaluator.evaluate(normalized_key) else _never_matches
+
+            return cls._compile_expression(normalized_key)
 
         # Simple value check (key exists in values)
-        if not values:
-            return False
+        stripped_key = normalized_key.strip()
 
-        search_value = substituted.strip()
-        return search_value in values or search_value in {str(v) for v in values.values()}
+        def matches_value(values: FormatParam | None) -> bool:
+            if not values:
+                return False
+
+            search_value = (
+                ValueSubstitutor.substitute(normalized_key, values).strip() if has_placeholders else stripped_key
+            )
+            return search_value in values or any(str(value) == search_value for value in values.values())
+
+        return matches_value
 
     @classmethod
     @functools.lru_cache(maxsize=512)
@@ -144,6 +198,47 @@ class ConditionalKeyEvaluator:
         # Ensure no reserved words present
         return all(word not in normalized for word in cls._RESERVED_WORDS)
 
+    @staticmethod
+    def _compile_expression(expression: str) -> ConditionFunc:
+        """Compile a normalized expression with placeholders into a predicate.
+
+        Each distinct placeholder becomes a parameter of a function compiled
+        once, and values are converted to operands exactly as they would read
+        when substituted into the text.
+
+        Args:
+            expression: Normalized expression containing placeholders
+
+        Returns:
+            Predicate taking the values and returning the boolean result
+        """
+        names = list(dict.fromkeys(ValueSubstitutor.extract_placeholders(expression)))
+
+        # Parameter names must not collide with names written in the expression itself
+        prefix = "arg"
+        while prefix in expression:
+            prefix += "_"
+        params = {name: f"{prefix}{index}" for index, name in enumerate(names)}
+
+        try:
+            predicate = ASTExpressionEvaluator.compile_predicate(
+                ValueSubstitutor.substitute(expression, params), tuple(params.values())
+            )
+        except (ValueError, TypeError):
+            return _never_matches
+
+        def matches_expression(values: FormatParam | None) -> bool:
+            # Unsubstituted placeholders leave the expression invalid
+            if not values:
+                return False
+
+            try:
+                return predicate(*[_to_operand(values[name]) for name in names])
+            except (KeyError, ValueError, TypeError):
+                return False
+
+        return matches_expression
+
     @staticmethod
     def _normalize_operators(expression: str) -> str:
         """Normalize logical operators to Python syntax.
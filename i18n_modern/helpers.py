@@ -9,11 +9,12 @@ Optimizations added:
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping
 from typing import cast
 
 from .conditional_evaluator import ConditionalKeyEvaluator
-from .types import FormatParam, LocaleDict, LocaleValue
+from .types import ConditionFunc, FormatParam, LocaleDict, LocaleValue
 from .value_substitution import ValueSubstitutor
 
 
@@ -78,6 +79,40 @@ def get_deep_value(obj: LocaleValue | None, path: str) -> LocaleValue | None:
     return TreePathVisitor(path.split(".")).visit(obj)
 
 
+def flatten_deep(obj: Mapping[str, LocaleValue], prefix: str = "") -> dict[str, LocaleValue]:
+    """
+    Flatten a deep object into a mapping keyed by dot notation paths.
+
+    Every path reachable with :func:`get_deep_value` is included: leaf values as
+    well as the nested objects themselves, which hold conditional translations.
+    Paths are interned so lookups with literal keys match by identity.
+
+    Args:
+        obj: Object to flatten
+        prefix: Path prefix for the keys of ``obj`` (e.g., "user.")
+
+    Returns:
+        Flat mapping of full paths to values
+    """
+    flat: dict[str, LocaleValue] = {}
+    _flatten_into(flat, obj, prefix)
+    return flat
+
+
+def _flatten_into(flat: dict[str, LocaleValue], obj: Mapping[str, LocaleValue], prefix: str) -> None:
+    """Recursive helper for :func:`flatten_deep` that fills ``flat`` in place."""
+
+    for key, value in obj.items():
+        # Keys that are not strings or contain dots are unreachable with dot notation
+        if not isinstance(key, str) or "." in key:
+            continue
+
+        path = sys.intern(prefix + key)
+        flat[path] = value
+        if isinstance(value, Mapping):
+            _flatten_into(flat, cast(Mapping[str, LocaleValue], value), path + ".")
+
+
 def _get_from_segments(current: LocaleValue | None, segments: list[str]) -> LocaleValue | None:
     """Recursive helper to walk nested mappings using the provided path segments."""
 
@@ -108,6 +143,19 @@ def eval_key(key: str, values: FormatParam | None = None) -> bool:
     return ConditionalKeyEvaluator.evaluate(key, values)
 
 
+def compile_key(key: str) -> ConditionFunc:
+    """
+    Compile a key object string into a predicate over values.
+
+    Args:
+        key: Key to compile
+
+    Returns:
+        Predicate taking the values and returning the boolean result
+    """
+    return ConditionalKeyEvaluator.compile(key)
+
+
 def format_value(string: str, values: FormatParam | None = None) -> str:
     """
     Replace [value] in string with actual values.
@@ -119,7 +167,7 @@ def format_value(string: str, values: FormatParam | None = None) -> str:
     Returns:
         Formatted string
     """
-    if values is None or not values:
+    if not values or "[" not in string:
         return string
 
     return ValueSubstitutor.substitute(string, values)
@@ -3,15 +3,19 @@ Module to get translation from locales.
 
 Author: Uriel Curiel <urielcurrel@outlook.com>
 """
+import functools
 import json
 import logging
-from collections.abc import Iterable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import mmap
+import os
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import cast
+from typing import Literal, NamedTuple, TypeAlias, cast
 
-from i18n_modern.helpers import eval_key, format_value, get_deep_value, merge_deep
-from i18n_modern.types import FormatParam, LocaleDict, Locales, LocaleValue, CacheDict
+from i18n_modern.helpers import compile_key, flatten_deep, format_value, merge_deep
+from i18n_modern.types import ConditionFunc, FormatParam, FormatValue, FrozenFormatParam, LocaleDict, Locales, LocaleValue
 
 try:
     import yaml
@@ -23,6 +27,121 @@ try:
 except ImportError:
     tomli = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> LocaleDict:
+    """Decode JSON locale data from raw bytes, using orjson when installed."""
+    if orjson is not None:
+        return cast(LocaleDict, orjson.loads(data))
+    return cast(LocaleDict, json.loads(data))
+
+
+# Files below this size are read in one call; memory-mapping only pays off for large files
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def _load_json(path: Path) -> LocaleDict:
+    """Load a JSON locale file, memory-mapping it only when it is large."""
+    if path.stat().st_size < _MMAP_THRESHOLD:
+        return _json_loads(path.read_bytes())
+
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _json_loads(mm.read())
+    except OSError:
+        return _json_loads(path.read_bytes())
+
+
+def _load_yaml(path: Path) -> LocaleDict:
+    """Load a YAML locale file."""
+    if yaml is None:
+        raise ImportError("PyYAML is required for YAML support. Install with: pip install pyyaml")
+    with open(path, "r", encoding="utf-8") as f:
+        return cast(LocaleDict, yaml.safe_load(f))  # type: ignore
+
+
+def _load_toml(path: Path) -> LocaleDict:
+    """Load a TOML locale file."""
+    if tomli is None:
+        raise ImportError("tomli is required for TOML support. Install with: pip install tomli")
+    with open(path, "rb") as f:
+        return cast(LocaleDict, tomli.load(f))  # type: ignore
+
+
+# Locale file loaders by lowercase file suffix
+_LOADERS: dict[str, Callable[[Path], LocaleDict]] = {
+    ".json": _load_json,
+    ".yaml": _load_yaml,
+    ".yml": _load_yaml,
+    ".toml": _load_toml,
+}
+
+# Suffixes whose parsers hold the GIL for the whole parse and so only scale across processes
+_PROCESS_SUFFIXES: frozenset[str] = frozenset((".yaml", ".yml", ".toml"))
+# Minimum total size of such files before worker processes pay off
+_PROCESS_POOL_THRESHOLD = 8 * 1024 * 1024
+
+
+def _load_file(path: Path) -> LocaleDict:
+    """Load a single locale file from a path, dispatching on its suffix.
+
+    Module-level so that process pools can pickle it. A missing file surfaces as
+    the FileNotFoundError raised when the loader opens it.
+    """
+    suffix = path.suffix.lower()
+    loader = _LOADERS.get(suffix)
+    if loader is None:
+        raise ValueError(f"Unsupported file format: {suffix}. Supported formats: .json, .yaml, .yml, .toml")
+    return loader(path)
+
+
+def _prefers_processes(paths: list[Path]) -> bool:
+    """Check whether the GIL-bound part of a batch is large enough for worker processes."""
+    count = 0
+    total = 0
+    for path in paths:
+        if path.suffix.lower() not in _PROCESS_SUFFIXES:
+            continue
+        try:
+            total += path.stat().st_size
+        except OSError:
+            continue
+        count += 1
+    return count > 1 and total >= _PROCESS_POOL_THRESHOLD
+
+
+_CompiledValue: TypeAlias = "str | _Conditional"
+
+
+class _Conditional(NamedTuple):
+    """Conditional translation group whose keys are compiled to predicates."""
+
+    branches: tuple[tuple[ConditionFunc, _CompiledValue], ...]
+    # Pre-stringified "default" entry of the group, if any
+    default: str | None
+
+
+def _compile_translation(value: LocaleValue) -> _CompiledValue:
+    """Compile the condition keys of a translation value, recursively.
+
+    Args:
+        value: Translation value (string or dict of conditional keys)
+
+    Returns:
+        The value itself for leaves, or a compiled conditional group
+    """
+    if not isinstance(value, dict):
+        return value
+
+    branches = tuple((compile_key(str(key)), _compile_translation(child)) for key, child in value.items())
+    default = str(value["default"]) if "default" in value else None
+    return _Conditional(branches, default)
+
 
 class I18nModern:
     """
@@ -31,12 +150,14 @@ class I18nModern:
     Args:
         default_locale: The default locale
         locales: The locales variable (dict) or path to locale file
+        cache_max_size: Maximum number of cached translations per locale
     """
 
     __slots__ = (
         "_locales",
+        "_flat_locales",
         "_default_locale",
-        "_previous_translations",
+        "_resolvers",
         "_cache_max_size",
     )
 
@@ -48,10 +169,14 @@ class I18nModern:
             cache_max_size: int = 2048
     ):
         self._locales: Locales = {}
-        self._default_locale: str = default_locale
-        # Increased cache size for better performance (was unbounded)
-        self._previous_translations: CacheDict = {}
+        # Every dot notation path of each locale, so lookups are a single dict access
+        # Dicts are replaced by their compiled conditional group on first lookup
+        self._flat_locales: dict[str, dict[str, LocaleValue | _Conditional]] = {}
+        self._default_locale: str = sys.intern(default_locale)
         self._cache_max_size: int = cache_max_size  # Limit cache size to prevent unbounded growth
+        # Bounded LRU caches of formatted translations, one per locale so that
+        # reloading a locale only drops its own entries
+        self._resolvers: dict[str, functools._lru_cache_wrapper[str]] = {}
 
         if cache_max_size <= 0:
             raise ValueError("cache_max_size must be a positive integer")
@@ -69,7 +194,7 @@ class I18nModern:
     @default_locale.setter
     def default_locale(self, value: str):
         """Set the default locale."""
-        self._default_locale = value
+        self._default_locale = sys.intern(value)
 
     def load_from_file(self, file_path: str | Path, locale_identify: str):
         """
@@ -84,35 +209,11 @@ class I18nModern:
         if not path.exists():
             raise FileNotFoundError(f"Locale file not found: {file_path}")
 
-        suffix: str = path.suffix.lower()
-
-        if suffix == ".json":
-            # Try memory-mapped style reading for very large files
-            try:
-                import mmap
-
-                with open(path, "rb") as f:
-                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                        data = cast(LocaleDict, json.loads(mm.read().decode("utf-8")))
-            except Exception:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = cast(LocaleDict, json.load(f))
-        elif suffix in [".yaml", ".yml"]:
-            if yaml is None:
-                raise ImportError("PyYAML is required for YAML support. Install with: pip install pyyaml")
-            with open(path, "r", encoding="utf-8") as f:
-                data = cast(LocaleDict, yaml.safe_load(f))  # type: ignore
-        elif suffix == ".toml":
-            if tomli is None:
-                raise ImportError("tomli is required for TOML support. Install with: pip install tomli")
-            with open(path, "rb") as f:
-                data = cast(LocaleDict, tomli.load(f))  # type: ignore
-        else:
-            raise ValueError(f"Unsupported file format: {suffix}. Supported formats: .json, .yaml, .yml, .toml")
-
+        data = _load_file(path)
         self._update_locales(locale_identify, data)
 
     def _update_locales(self, locale_identify: str, data: LocaleDict):
+        locale_identify = sys.intern(locale_identify)
         self._locales[locale_identify] = merge_deep(
             self._locales.get(
                 locale_identify,
@@ -120,56 +221,46 @@ class I18nModern:
             ),
             data
         )
+        self._flat_locales[locale_identify] = flatten_deep(self._locales[locale_identify])
         # Clear the corresponding translation cache to apply the new translated text
-        for key, locale, values_tuple in list(self._previous_translations.keys()):
-            if locale == locale_identify:
-                del self._previous_translations[(key, locale, values_tuple)]
-
-    def _load_path(self, path: Path) -> LocaleDict:
-        """Load a single locale file from a path with mmap optimization for JSON."""
-        suffix = path.suffix.lower()
-        if suffix == ".json":
-            try:
-                import mmap
-
-                with open(path, "rb") as f:
-                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                        return cast(LocaleDict, json.loads(mm.read().decode("utf-8")))
-            except Exception:
-                with open(path, "r", encoding="utf-8") as f:
-                    return cast(LocaleDict, json.load(f))
-        if suffix in [".yaml", ".yml"]:
-            if yaml is None:
-                raise ImportError("PyYAML is required for YAML support. Install with: pip install pyyaml")
-            with open(path, "r", encoding="utf-8") as f:
-                return cast(LocaleDict, yaml.safe_load(f))  # type: ignore
-        if suffix == ".toml":
-            if tomli is None:
-                raise ImportError("tomli is required for TOML support. Install with: pip install tomli")
-            with open(path, "rb") as f:
-                return cast(LocaleDict, tomli.load(f))  # type: ignore
-        raise ValueError(f"Unsupported file format: {suffix}. Supported formats: .json, .yaml, .yml, .toml")
-
-    def _task_load_locale(self, file_path: str | Path, locale: str) -> tuple[str, LocaleDict]:
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Locale file not found: {file_path}")
-        return locale, self._load_path(path)
+        # typed=True keeps {"n": 1}, {"n": True} and {"n": 1.0} apart: they format differently.
+        # It does not look inside frozensets, so get() types the items of several values itself
+        self._resolvers[locale_identify] = functools.lru_cache(maxsize=self._cache_max_size, typed=True)(
+            functools.partial(self._resolve_hashable, locale_identify)
+        )
 
-    def load_many(self, files: Iterable[tuple[str, str]], max_workers: int | None = None) -> None:
+    def load_many(
+            self,
+            files: Iterable[tuple[str, str]],
+            max_workers: int | None = None,
+            parallelism: Literal["thread", "process", "auto"] = "auto",
+    ) -> None:
         """Load multiple locale files concurrently.
 
         Args:
             files: Iterable of tuples (file_path, locale_identify)
-            max_workers: Optional maximum number of worker threads
+            max_workers: Optional maximum number of workers
+            parallelism: "thread" to parse in worker threads, "process" to parse in
+                worker processes, or "auto" to use processes only when there is
+                enough YAML/TOML input to outweigh their startup cost
         """
+        jobs = [(Path(fp), loc) for fp, loc in files]
+
+        if parallelism == "process" or (parallelism == "auto" and _prefers_processes([path for path, _ in jobs])):
+            executor_cls = ProcessPoolExecutor
+            # Worker processes all start up front, so never start more than there are files
+            max_workers = max_workers or max(1, min(len(jobs), os.cpu_count() or 1))
+        elif parallelism in ("thread", "auto"):
+            executor_cls = ThreadPoolExecutor
+        else:
+            raise ValueError(f"Unsupported parallelism: {parallelism}. Supported values: thread, process, auto")
 
         # Load in parallel and merge safely once complete
         results: list[tuple[str, LocaleDict]] = []
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(self._task_load_locale, fp, loc) for fp, loc in files]
+        with executor_cls(max_workers=max_workers) as executor:
+            futures = {executor.submit(_load_file, path): loc for path, loc in jobs}
             for fut in as_completed(futures):
-                results.append(fut.result())
+                results.append((futures[fut], fut.result()))
 
         # Merge results into _locales
         for locale, data in results:
@@ -202,73 +293,124 @@ class I18nModern:
         """
         try:
             locale = locale or self._default_locale
-            # values_tuple = tuple(sorted(values.items())) if values else None
-            # values_tuple = frozenset(values.items()) if values else None
-            values_tuple = tuple(values.items()) if values else None
-            cache_key = (key, locale, values_tuple)
-
-            if cache_key in self._previous_translations:
-                return self._previous_translations[cache_key]
-
-            if locale not in self._locales:
+            resolver = self._resolvers.get(locale)
+            if resolver is None:
                 raise KeyError(f"Locale '{locale}' not found in locales")
 
-            translation: LocaleValue | None = get_deep_value(self._locales[locale], key)
-
-            if translation is None:
-                raise KeyError(f"Translation key '{key}' not found in locale '{locale}'")
+            if not values:
+                # Empty values never affect formatting, so share the shorter key
+                return resolver(key)
 
-            result = self._get_translation(translation, values)
+            if len(values) == 1:
+                # Most calls pass a single value: key the cache on it directly
+                # instead of allocating a frozenset of the items
+                ((name, value),) = values.items()
+                if not isinstance(value, (str, int, float, bool)):
+                    # Other value types may be unhashable, so they bypass the cache
+                    return self._resolve(key, locale, values)
+                return resolver(key, name, value)
 
-            # Bounded cache - prevent unbounded growth
-            if len(self._previous_translations) >= self._cache_max_size:
-                # Simple FIFO eviction: remove the oldest items (first half)
-                limit = self._cache_max_size // 4 if self._cache_max_size > 4 else 1
-                keys_to_remove = list(self._previous_translations.keys())[: limit]
-                for k in keys_to_remove:
-                    del self._previous_translations[k]
+            try:
+                # frozenset makes the key independent of the values' insertion order; typed=True
+                # only sees the frozenset, so each item carries its value's type itself
+                values_frozen = frozenset((name, type(value), value) for name, value in values.items())
+            except TypeError:
+                # Unhashable values (e.g. nested dicts) bypass the cache
+                return self._resolve(key, locale, values)
 
-            self._previous_translations[cache_key] = result
-            return result
+            return resolver(key, values_frozen)
 
         except Exception as error:
             logging.warning("Error: the key '%s' is not defined in locales - %s", key, error)
             return key
 
+    def _resolve_hashable(self, locale: str, key: str, *values_key: str | FormatValue | FrozenFormatParam) -> str:
+        """
+        Resolve a translation from hashable arguments; wrapped by the per-locale LRU caches.
+
+        Args:
+            locale: Locale to resolve the key in
+            key: Translation key (supports dot notation)
+            *values_key: Nothing without values, ``(name, value)`` for a single
+                value, or the frozen ``(name, type, value)`` items of several values
+
+        Returns:
+            Translated string
+        """
+        if not values_key:
+            values = None
+        elif len(values_key) == 2:
+            values = {cast(str, values_key[0]): cast(FormatValue, values_key[1])}
+        else:
+            values = {name: value for name, _, value in cast(FrozenFormatParam, values_key[0])}
+        return self._resolve(key, locale, values)
+
+    def _resolve(self, key: str, locale: str, values: FormatParam | None) -> str:
+        """
+        Look up and format a translation without consulting the cache.
+
+        Args:
+            key: Translation key (supports dot notation)
+            locale: Locale to resolve the key in
+            values: Optional values for placeholder replacement
+
+        Returns:
+            Translated string
+
+        Raises:
+            KeyError: If the locale or the key is not defined
+        """
+        flat_locale = self._flat_locales.get(locale)
+        if flat_locale is None:
+            raise KeyError(f"Locale '{locale}' not found in locales")
+
+        translation = flat_locale.get(key)
+
+        if translation is None:
+            raise KeyError(f"Translation key '{key}' not found in locale '{locale}'")
+
+        if isinstance(translation, dict):
+            # Only dicts actually used as conditional groups get their keys compiled
+            translation = flat_locale[key] = _compile_translation(translation)
+
+        return self._get_translation(translation, values)
+
     def _get_translation(
-            self, translation: LocaleValue, values: FormatParam | None = None, default_translation: str | None = None
+            self, translation: _CompiledValue, values: FormatParam | None = None, default_translation: str | None = None
     ) -> str:
         """
         Get a translation from object and format it.
 
         Args:
-            translation: Translation value (string or dict)
+            translation: Translation value (string or compiled conditional group)
             values: Optional values for placeholder replacement
             default_translation: Optional default translation
 
         Returns:
             Formatted translation string
         """
-        if isinstance(translation, dict) and "default" in translation:
-            default_translation = str(translation["default"])
-
-        if not isinstance(translation, str):
-            # Find matching key based on condition
-            for key in translation.keys():  # type: ignore
-                if eval_key(key, values):  # type: ignore
-                    return self._get_translation(
-                        translation[key],
-                        values,
-                        default_translation,  # type: ignore
-                    )
-
-            # Return default if no key matches
-            if default_translation:
-                # return self._get_translation(default_translation, values, default_translation)  # type: ignore
-                return format_value(default_translation, values)  # type: ignore
-            return ""
-
-        return format_value(translation, values)
+        if isinstance(translation, str):
+            # Most translations have no placeholders: skip the substitution call entirely
+            if not values or "[" not in translation:
+                return translation
+            return format_value(translation, values)
+
+        if not isinstance(translation, _Conditional):
+            raise TypeError(f"Unsupported translation value: {translation!r}")
+
+        if translation.default is not None:
+            default_translation = translation.default
+
+        # Find matching key based on condition
+        for matches, value in translation.branches:
+            if matches(values):
+                return self._get_translation(value, values, default_translation)
+
+        # Return default if no key matches
+        if default_translation:
+            # return self._get_translation(default_translation, values, default_translation)  # type: ignore
+            return format_value(default_translation, values)  # type: ignore
+        return ""
 
 
 class _LazyLoader:
@@ -1,5 +1,6 @@
 """Type definitions for :mod:`i18n_modern`."""
 
+from collections.abc import Callable
 from typing import TypeAlias
 
 LocaleValue: TypeAlias = "str | LocaleDict"
@@ -8,13 +9,17 @@ Locales: TypeAlias = dict[str, LocaleDict]
 
 FormatValue: TypeAlias = bool | float | int | str
 FormatParam: TypeAlias = dict[str, FormatValue]
+FrozenFormatParam: TypeAlias = frozenset[tuple[str, type, FormatValue]]
+ConditionFunc: TypeAlias = Callable[[FormatParam | None], bool]
 
 CacheKeyType: TypeAlias = tuple[str, str | None, frozenset[FormatParam] | None]
 CacheDict: TypeAlias = dict[CacheKeyType, str]
 
 __all__ = [
+    "ConditionFunc",
     "FormatParam",
     "FormatValue",
+    "FrozenFormatParam",
     "LocaleDict",
     "LocaleValue",
     "Locales",
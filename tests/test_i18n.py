@@ -2,8 +2,8 @@
 
 import pytest
 
-from i18n_modern import I18nModern
-from i18n_modern.types import LocaleDict
+from i18n_modern import ASTExpressionEvaluator, I18nModern
+from i18n_modern.types import FormatParam, LocaleDict
 
 
 @pytest.fixture
@@ -51,6 +51,13 @@ class TestI18nModern:
         assert i18n.get("messages.success") == "Success!"
         assert i18n.get("messages.error") == "Error!"
 
+    def test_deeply_nested_keys(self) -> None:
+        """Test lookups through several nesting levels and dotted key names."""
+        i18n = I18nModern("en", {"a": {"b": {"c": "Deep!"}}, "x.y": "Unreachable"})
+        assert i18n.get("a.b.c") == "Deep!"
+        assert i18n.get("a.b.missing") == "a.b.missing"
+        assert i18n.get("x.y") == "x.y"
+
     def test_conditional_translations(self, conditional_locales: LocaleDict) -> None:
         """Test conditional translations."""
         i18n = I18nModern("en", conditional_locales)
@@ -64,6 +71,58 @@ class TestI18nModern:
         assert i18n.get("age_group", values={"age": 15}) == "Minor"
         assert i18n.get("age_group", values={"age": 25}) == "Adult"
 
+    def test_nested_conditions(self) -> None:
+        """Test conditional groups nested inside other conditional groups."""
+        i18n = I18nModern(
+            "en",
+            {
+                "inbox": {
+                    "[unread] > 0": {"[unread] == 1": "One new message", "default": "[unread] new messages"},
+                    "default": "No new messages",
+                }
+            },
+        )
+        assert i18n.get("inbox", values={"unread": 0}) == "No new messages"
+        assert i18n.get("inbox", values={"unread": 1}) == "One new message"
+        assert i18n.get("inbox", values={"unread": 4}) == "4 new messages"
+
+    def test_condition_with_missing_placeholder(self) -> None:
+        """Test that a reachable branch with a missing placeholder invalidates the condition."""
+        i18n = I18nModern("en", {"check": {"[a] > 1 || [b] == 2": "match", "default": "nomatch"}})
+        assert i18n.get("check", values={"b": 2}) == "nomatch"
+        assert i18n.get("check", values={"a": 2, "b": 0}) == "match"
+
+    @pytest.mark.parametrize(
+        "key,values,expected",
+        [
+            ("[premium] && [n] > 1", {"premium": True, "n": 3}, "match"),
+            ("[n] > 1 && [premium]", {"premium": True, "n": 3}, "match"),
+            ("[premium] || [n] > 1", {"premium": False, "n": 2}, "match"),
+            ("[premium] && [n] > 1", {"premium": "True", "n": 3}, "match"),
+            ("[premium] && [n] > 1", {"premium": False, "n": 3}, "other"),
+            ("[premium] && [n] > 1", {"premium": 1, "n": 3}, "other"),
+        ],
+    )
+    def test_condition_with_boolean_placeholder(self, key: str, values: FormatParam, expected: str) -> None:
+        """Test that a placeholder used directly as an and/or operand must hold a bool."""
+        i18n = I18nModern("en", {"check": {key: "match", "default": "other"}})
+        assert i18n.get("check", values=values) == expected
+
+    def test_condition_values_read_as_operands(self, comparison_locales: LocaleDict) -> None:
+        """Test that placeholder values compare as their text would read in the key."""
+        i18n = I18nModern("en", comparison_locales)
+        assert i18n.get("age_group", values={"age": "20"}) == "Adult"
+        assert i18n.get("age_group", values={"age": -1.5}) == "Minor"
+        assert i18n.get("age_group", values={"age": "unknown"}) == "Unknown"
+        assert i18n.get("age_group", values={"age": " 20 "}) == "Adult"
+
+    def test_nested_dict_as_condition_group(self, nested_locales: LocaleDict) -> None:
+        """Test that a nested dict still resolves by path after being used as a conditional group."""
+        i18n = I18nModern("en", nested_locales)
+        assert i18n.get("messages.success") == "Success!"
+        assert i18n.get("messages", values={"x": "error"}) == "Error!"
+        assert i18n.get("messages.success") == "Success!"
+
     def test_memoization(self, memoization_locales: LocaleDict) -> None:
         """Test that memoization works."""
         i18n = I18nModern("en", memoization_locales)
@@ -75,6 +134,60 @@ class TestI18nModern:
 
         assert result1 == result2 == "Hello, World!"
 
+    def test_memoization_ignores_values_order(self) -> None:
+        """Test that values dicts differing only in order share a cache entry."""
+        i18n = I18nModern("en", {"pair": "[a] and [b]"})
+
+        assert i18n.get("pair", values={"a": 1, "b": 2}) == "1 and 2"
+        assert i18n.get("pair", values={"b": 2, "a": 1}) == "1 and 2"
+
+    def test_memoization_distinguishes_value_types(self) -> None:
+        """Test that equal values of different types are cached separately."""
+        i18n = I18nModern("en", {"x": "[n]"})
+
+        assert i18n.get("x", values={"n": 1}) == "1"
+        assert i18n.get("x", values={"n": True}) == "True"
+        assert i18n.get("x", values={"n": 1.0}) == "1.0"
+
+        i18n = I18nModern("en", {"p": "Hi [name]"})
+        assert i18n.get("p", values={"name": 1, "x": 1}) == "Hi 1"
+        assert i18n.get("p", values={"name": True, "x": 1}) == "Hi True"
+        assert i18n.get("p", values={"name": 1.0, "x": 1}) == "Hi 1.0"
+
+    def test_unhashable_values_bypass_cache(self, memoization_locales: LocaleDict) -> None:
+        """Test that unhashable values are formatted without being cached."""
+        i18n = I18nModern("en", memoization_locales)
+
+        assert i18n.get("greeting", values={"name": ["World"]}) == "Hello, ['World']!"  # type: ignore[dict-item]
+        assert i18n.get("greeting", values={"name": ["World"], "x": {}}) == "Hello, ['World']!"  # type: ignore[dict-item]
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """Test that the bounded cache evicts the least recently used entry."""
+        i18n = I18nModern("en", {"a": "A", "b": "B", "c": "C"}, cache_max_size=2)
+
+        i18n.get("a")
+        i18n.get("b")
+        i18n.get("a")  # refresh "a" so "b" becomes least recently used
+        i18n.get("c")
+        assert i18n._resolvers["en"].cache_info().hits == 1
+
+        i18n.get("a")
+        assert i18n._resolvers["en"].cache_info().hits == 2
+        i18n.get("b")
+        assert i18n._resolvers["en"].cache_info().hits == 2
+
+    def test_reload_locale_after_cached_lookup(self, basic_locales: LocaleDict) -> None:
+        """Test that reloading a locale replaces its cached translations and keeps the others."""
+        i18n = I18nModern("en", basic_locales)
+        i18n.load_from_value({"welcome": "Bienvenido!"}, "es")
+        i18n.get("welcome")
+        i18n.get("welcome", "es")
+
+        i18n.load_from_value({"welcome": "¡Bienvenido!"}, "es")
+
+        assert i18n.get("welcome") == "Welcome!"
+        assert i18n.get("welcome", "es") == "¡Bienvenido!"
+
     def test_load_from_value(self) -> None:
         """Test loading from value."""
         i18n = I18nModern("en")
@@ -195,3 +308,83 @@ def test_multiple_loads_merge_locale() -> None:
     assert i18n.get("title", "zh") == "测试"
     assert i18n.get("message", "zh") == "你好, 世界"
 
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("True", True),
+        ("5 > 1", True),
+        ("5 >= 6", False),
+        ("1 < 2 < 3", True),
+        ("1 < 3 < 2", False),
+        ("-1 < 0", True),
+        ("'en' == 'en'", True),
+        ("'a' < 'b'", True),
+        ("2 > 1 and 'en' != 'es'", True),
+        ("2 < 1 or 1 == 1", True),
+        ("1 < 2 and 2 < 3 and 3 < 4", True),
+        ("1 > 2 or 2 > 3 or 3 < 4", True),
+        ("True and 1 > 2", False),
+        ("False or 'a' == 'a'", True),
+        ("1 == 1 or 'a' < 1", True),
+        ("2 == 1 or 'a' < 1", False),
+        ("'a' < 1 or 1 == 1", False),
+        ("name or 1 == 1", False),
+        ("True or name", True),
+        ("False and name", False),
+        ("'a' < 1 and 1 == 1", False),
+        ("'a' < 1", False),
+        ("name", False),
+        ("1 >", False),
+    ],
+)
+def test_ast_evaluator(expression: str, expected: bool) -> None:
+    """Test compiled AST expression evaluation."""
+    assert ASTExpressionEvaluator.evaluate(expression) is expected
+    # Second evaluation goes through the compiled cache
+    assert ASTExpressionEvaluator.evaluate(expression) is expected
+
+
+@pytest.mark.parametrize("parallelism", ["thread", "process", "auto"])
+def test_load_many(tmp_path, parallelism: str) -> None:
+    """Test concurrent loading of several locale files."""
+    (tmp_path / "en.json").write_text('{"welcome": "Welcome!"}', encoding="utf-8")
+    (tmp_path / "es.json").write_text('{"welcome": "¡Bienvenido!"}', encoding="utf-8")
+
+    i18n = I18nModern("en")
+    i18n.load_many(
+        [(str(tmp_path / "en.json"), "en"), (str(tmp_path / "es.json"), "es")],
+        max_workers=2,
+        parallelism=parallelism,  # type: ignore[arg-type]
+    )
+
+    assert i18n.get("welcome") == "Welcome!"
+    assert i18n.get("welcome", "es") == "¡Bienvenido!"
+
+
+def test_load_many_invalid_parallelism() -> None:
+    """Test that an unknown parallelism mode is rejected."""
+    with pytest.raises(ValueError):
+        I18nModern("en").load_many([], parallelism="fiber")  # type: ignore[arg-type]
+
+
+def test_load_many_missing_file(tmp_path) -> None:
+    """Test that a missing locale file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        I18nModern("en").load_many([(str(tmp_path / "missing.json"), "en")], parallelism="thread")
+
+
+def test_ast_compile_predicate() -> None:
+    """Test that parameterized expressions compile once and evaluate per call."""
+    in_range = ASTExpressionEvaluator.compile_predicate("n > 1 and n < 5", ("n",))
+    assert in_range(3) is True
+    assert in_range(7) is False
+
+    flagged = ASTExpressionEvaluator.compile_predicate("ok and n > 1", ("ok", "n"))
+    assert flagged(True, 2) is True
+    assert flagged(False, 2) is False
+    with pytest.raises(ValueError):
+        flagged(1, 2)
+
+    with pytest.raises(ValueError):
+        ASTExpressionEvaluator.compile_predicate("n >", ("n",))